@@ -8,16 +8,16 @@ from __future__ import annotations
 
 import asyncio
 from typing import List
-from datetime import datetime
+from datetime import date, datetime
 from zoneinfo import ZoneInfo
-from telethon import events
 
 from loguru import logger
 
 from ..config import settings
 from ..domain.model import TextMessage
-from ..domain.services import round_robin
+from ..domain.services import batched, round_robin
 from ..infrastructure.telegram_gateway import TelegramGateway
+from ..infrastructure.time_utils import seconds_until_hour, start_of_today
 
 
 class ForwardDailyTexts:
@@ -29,6 +29,15 @@ class ForwardDailyTexts:
         self._gw = gateway
         self._messages: List[TextMessage] = []
         self._idx: int = 0
+        self._empty_streak: int = 0
+        self._day: date | None = None  # local date self._messages belongs to
+        # new posts pushed by the gateway subscription, drained each round
+        self._queue: asyncio.Queue[TextMessage] = asyncio.Queue()
+        self._subscribed = False
+        # loop-invariant; bound once instead of on every window check
+        self._tz = ZoneInfo(settings.timezone)
+        self._start_hour = settings.start_hour
+        self._end_hour = settings.end_hour
 
     # ---------- helpers -----------------
     async def _load_targets(self) -> List[str]:
@@ -36,32 +45,78 @@ class ForwardDailyTexts:
             return await self._gw.list_public_groups()
         return settings.target_groups
 
+    def _append_new(self, msgs: List[TextMessage]) -> None:
+        """
+        Append today's posts newer than the last one held. Skips backfill
+        overlap and anything queued before local midnight.
+        """
+        day_start = start_of_today(settings.timezone)
+        last_id = self._messages[-1].message_id if self._messages else 0
+        for msg in msgs:
+            if msg.message_id > last_id and msg.date >= day_start:
+                self._messages.append(msg)
+                last_id = msg.message_id
+
     async def _refresh_messages(self) -> None:
-        self._messages = await self._gw.fetch_today_texts(
-            settings.source_channel, settings.timezone
-        )
-        self._idx = 0
+        """
+        Backfill today's history on a new day; otherwise just take the posts
+        the subscription queued since the last round.
+        """
+        if not self._subscribed:
+            # subscribe before the backfill so nothing posted in between is lost
+            await self._gw.subscribe_channel(settings.source_channel, self._queue)
+            self._subscribed = True
+        today = datetime.now(self._tz).date()
+        if today != self._day:
+            self._messages = await self._gw.fetch_today_texts(
+                settings.source_channel, settings.timezone
+            )
+            self._idx = 0
+            self._day = today
+        queued: List[TextMessage] = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        self._append_new(queued)
+
+    async def _wait_for_post(self, timeout: float) -> None:
+        """Block until the subscription delivers a post, or *timeout* passes."""
+        try:
+            msg = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return
+        self._append_new([msg])
 
     def _in_allowed_window(self) -> bool:
         """
         Check if current local time (in settings.timezone) is within
         [start_hour, end_hour).
         """
-        now_local = datetime.now(ZoneInfo(settings.timezone))
-        return settings.start_hour <= now_local.hour < settings.end_hour
+        h = datetime.now(self._tz).hour
+        return self._start_hour <= h < self._end_hour
+
+    def _idle_delay(self) -> float:
+        """
+        Longest wait for a post while none exist today: grows 1.5x per
+        consecutive miss, capped at settings.max_idle_sleep.
+        """
+        delay = settings.sleep_between_messages * 1.5 ** self._empty_streak
+        return min(delay, settings.max_idle_sleep)
 
     # ---------- public API ---------------
     async def daily_refresh(self) -> None:
+        self._day = None  # force a full reload
         await self._refresh_messages()
 
     async def run_forever(self) -> None:        
 
         while True:
             if not self._in_allowed_window():
+                # sleep straight to the window opening instead of re-polling
+                wait = seconds_until_hour(settings.timezone, settings.start_hour)
                 logger.debug(
-                    f"Outside allowed window {settings.start_hour}:00-{settings.end_hour}:00 ({settings.timezone}); sleeping {settings.sleep_between_messages}s."
+                    f"Outside allowed window {settings.start_hour}:00-{settings.end_hour}:00 ({settings.timezone}); sleeping {wait:.0f}s."
                 )
-                await asyncio.sleep(settings.sleep_between_messages)
+                await asyncio.sleep(wait)
                 continue
             await self._refresh_messages()
             targets = await self._load_targets()
@@ -69,14 +124,22 @@ class ForwardDailyTexts:
                 logger.error("No groups configured; stopping forwarder loop.")
                 return
             if not self._messages:
-                await asyncio.sleep(settings.sleep_between_messages)
+                # wake on the first new post; the timeout only re-checks the
+                # window and day, backing off while the channel stays quiet
+                self._empty_streak = min(self._empty_streak + 1, 32)
+                await self._wait_for_post(self._idle_delay())
                 continue
-
-            for self._idx, msg in round_robin(self._messages, self._idx):
-                logger.info(f"Forwarding msg {msg.message_id} (idx {self._idx})")
-                await self._gw.forward_text(
-                    targets, msg, delay=1  # delay between SAME msg / next group
-                )
+            self._empty_streak = 0
+
+            n = len(self._messages)
+            for batch in batched(
+                round_robin(self._messages, self._idx), settings.forward_batch
+            ):
+                ids = [m.message_id for m in batch]
+                logger.info(f"Forwarding msgs {ids} (idx {self._idx})")
+                # one request per target for the whole batch
+                await self._gw.forward_texts(targets, batch)
+                self._idx = (self._idx + len(batch)) % n
                 await asyncio.sleep(settings.sleep_between_messages)
 
 
@@ -85,43 +148,44 @@ class ForwardDailyTexts:
 class ForwardOnNew:
     """
     Subscribe to NewMessage events on the source channel and forward each
-    new *text-only* message immediately, one-by-one to the configured targets.
+    new *text-only* message immediately to all configured targets at once.
     """
 
     def __init__(self, gateway: TelegramGateway) -> None:
         self._gw = gateway
 
-    async def start(self) -> None:
-        client = self._gw.client
-        channel = settings.source_channel
-
-        @client.on(events.NewMessage(chats=channel))
-        async def handler(ev: events.NewMessage.Event) -> None:
-            m = ev.message
-            # skip anything without plain text
-            if not m.text:
-                return
-
-            tm = TextMessage(
-                message_id=m.id,
-                date=m.date,
-                content=m.text,
-                raw=m,
-            )
+    async def _load_targets(self) -> List[str]:
+        # decide targets just like daily mode
+        if settings.forward_to == "all":
+            return await self._gw.list_public_groups()
+        return settings.target_groups
 
-            # decide targets just like daily mode
-            if settings.forward_to == "all":
-                targets = await self._gw.list_public_groups()
-            else:
-                targets = settings.target_groups
+    async def _forward_new(self, tm: TextMessage) -> None:
+        targets = await self._load_targets()
+        if not targets:
+            logger.error(f"No targets in listen mode; dropping msg {tm.message_id}")
+            return
 
-            if not targets:
-                logger.error(f"No targets in listen mode; dropping msg {m.id}")
-                return
+        # the gateway fans out to every group concurrently (asyncio.gather),
+        # at most MAX_CONCURRENT_SENDS in flight, paced by its shared limiter
+        await self._gw.forward_text(targets, tm)
+        logger.info(f"Listen-mode forwarded msg {tm.message_id} to {len(targets)} targets")
 
-            # forward one by one with 1s gap per group
-            await self._gw.forward_text(targets, tm, delay=1)
-            logger.info(f"Listen-mode forwarded msg {m.id} to {len(targets)} targets")
+    async def _consume(self, queue: asyncio.Queue[TextMessage]) -> None:
+        while True:
+            tm = await queue.get()
+            # one failed post must not stop the consumer for all later ones
+            try:
+                await self._forward_new(tm)
+            except Exception as exc:  # noqa: BLE001
+                logger.error(f"Listen-mode failed to forward msg {tm.message_id}: {exc}")
 
-        # connect & run until Ctrl+C
-        await client.run_until_disconnected()
+    async def start(self) -> None:
+        queue: asyncio.Queue[TextMessage] = asyncio.Queue()
+        await self._gw.subscribe_channel(settings.source_channel, queue)
+        consumer = asyncio.create_task(self._consume(queue))
+        try:
+            # connect & run until Ctrl+C
+            await self._gw.client.run_until_disconnected()
+        finally:
+            consumer.cancel()
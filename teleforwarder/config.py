@@ -31,6 +31,12 @@ class Settings(BaseSettings):
     forward_mode: str = Field("daily", alias="FORWARD_MODE")
 
     sleep_between_messages: int = Field(60, ge=1, alias="SLEEP_BETWEEN_MESSAGES")
+    max_idle_sleep: int = Field(3600, ge=1, alias="MAX_IDLE_SLEEP")
+    forward_batch: int = Field(1, ge=1, le=100, alias="FORWARD_BATCH")
+
+    forward_rate: int = Field(30, ge=1, alias="FORWARD_RATE")
+    forward_rate_period: float = Field(1, gt=0, alias="FORWARD_RATE_PERIOD")
+    max_concurrent_sends: int = Field(8, ge=1, alias="MAX_CONCURRENT_SENDS")
 
     model_config = SettingsConfigDict(
         env_file = str(Path(__file__).parent.parent / ".env"), 
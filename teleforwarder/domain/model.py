@@ -18,4 +18,9 @@ class TextMessage:
     message_id: int
     date:       datetime
     content:    str
-    raw:        Any            # original Telethon object (optional)
+    raw:        Any            # original Telethon object (forwarded as-is)
+
+    def __post_init__(self) -> None:
+        # senders forward `raw` unchecked, so reject incomplete messages here
+        if self.raw is None:
+            raise ValueError(f"TextMessage {self.message_id} has no raw message")
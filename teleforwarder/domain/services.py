@@ -6,24 +6,37 @@ Pure-domain services (no IO).
 
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 
-def round_robin(messages: List, index: int) -> Iterable[tuple[int, object]]:
+def round_robin(messages: List, start: int) -> Iterator[object]:
     """
-    Infinite generator that yields (next_index, message) tuples in round-robin
-    order. Caller keeps the `index` cursor.
+    Generator that yields each message once in round-robin order, beginning
+    at `start`. Caller keeps the index cursor.
 
     Usage
     -----
     >>> idx = 0
-    >>> for idx, msg in round_robin(msgs, idx):
-    ...     process(msg); time.sleep(...)
+    >>> for msg in round_robin(msgs, idx):
+    ...     process(msg); idx = (idx + 1) % len(msgs)
     """
-    if not messages:
-        return
-    length = len(messages)
-    i = index
-    for _ in range(length):
-        yield i, messages[i]
-        i = (i + 1) % length
+    n = len(messages)
+    for k in range(n):
+        yield messages[(start + k) % n]
+
+
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    """
+    Split *items* into consecutive lists of at most *size* elements.
+
+    >>> list(batched([1, 2, 3], 2))
+    [[1, 2], [3]]
+    """
+    batch: list = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -4,4 +4,14 @@ Loguru configuration used by the whole app.
 
 from loguru import logger
 
-logger.add("forwarder.log", rotation="10 MB", retention="10 days")
+# enqueue=True hands records to a writer thread so file I/O (and rotation)
+# never blocks the event loop; diagnose=False skips frame-variable dumps
+logger.add(
+    "forwarder.log",
+    rotation="10 MB",
+    retention="10 days",
+    compression="zip",
+    enqueue=True,
+    backtrace=False,
+    diagnose=False,
+)
@@ -0,0 +1,58 @@
+"""Async token-bucket used to pace outgoing Telegram requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class AsyncLimiter:
+    """
+    Allow at most *max_rate* acquisitions per *time_period* seconds.
+
+    The bucket starts full, so bursts up to *max_rate* go through at once and
+    only sustained traffic has to wait for tokens to refill.
+
+    Usage
+    -----
+    >>> limiter = AsyncLimiter(30, 1)
+    >>> async with limiter:
+    ...     await client.forward_messages(peer, msg)
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60) -> None:
+        self._capacity = float(max_rate)
+        self._refill_rate = max_rate / time_period  # tokens per second
+        self._tokens = self._capacity
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last) * self._refill_rate
+        )
+        self._last = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until *amount* tokens are available and take them."""
+        if amount > self._capacity:
+            raise ValueError(
+                f"Cannot acquire {amount} tokens from a bucket of {self._capacity:g}"
+            )
+        # the lock keeps waiters FIFO so nobody starves under contention
+        async with self._lock:
+            self._refill()
+            if self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self._refill_rate)
+                self._refill()
+                # the sleep covered the shortfall; a coarse clock or float
+                # rounding must not leave us spinning on a sliver of a token
+                self._tokens = max(self._tokens, amount)
+            self._tokens -= amount
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
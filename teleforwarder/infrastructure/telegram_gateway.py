@@ -7,23 +7,72 @@ Telegram gateway - the *only* Telethon-aware class.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-from typing import Iterable, List
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, TypeVar
 
 from loguru import logger
-from telethon import TelegramClient
-from telethon.errors import FloodWaitError
-from telethon.tl.custom.message import Message
-from telethon.tl.types import Dialog
+from telethon import TelegramClient, events
+from telethon.errors import FloodWaitError, PeerIdInvalidError
+from telethon.tl.types import MessageMediaWebPage
 
 from teleforwarder.domain.model import TextMessage
+from teleforwarder.infrastructure.rate_limiter import AsyncLimiter
 from teleforwarder.infrastructure.time_utils import start_of_today
 
+# Telegram accepts at most 100 message ids per ForwardMessagesRequest; batches
+# are further capped at the limiter's capacity (FORWARD_RATE)
+FORWARD_BATCH_SIZE = 100
+# attempts per batch before a flood-wait is reported as a failed target
+FLOOD_RETRIES = 5
+# longest single cooldown honoured before retrying a flooded peer
+MAX_FLOOD_WAIT_SECONDS = 600
+# resolved peers kept before the entity cache is reset
+ENTITY_CACHE_SIZE = 1024
+# flood-waits up to this long are slept through by Telethon itself (this also
+# covers its update catch-up); longer ones surface here and are retried
+FLOOD_SLEEP_THRESHOLD = 5
+
+T = TypeVar("T")
+
+
+def _is_text_post(m: Any) -> bool:
+    """
+    Plain-text post. A link preview (``MessageMediaWebPage``) still counts as
+    text; photos, files and other real media do not.
+    """
+    return bool(m.message) and (
+        m.media is None or isinstance(m.media, MessageMediaWebPage)
+    )
+
+
 class TelegramGateway:
     """IO-Port used by application layer."""
 
-    def __init__(self, session: str, api_id: int, api_hash: str) -> None:
-        self._client = TelegramClient(session, api_id, api_hash)
+    def __init__(
+        self,
+        session: str,
+        api_id: int,
+        api_hash: str,
+        max_rate: float = 30,
+        time_period: float = 1,
+        max_concurrent_sends: int = 8,
+    ) -> None:
+        # keep Telethon's silent flood sleep short so real stalls surface
+        self._client = TelegramClient(
+            session, api_id, api_hash, flood_sleep_threshold=FLOOD_SLEEP_THRESHOLD
+        )
+        # shared by every send so bursts pass and only sustained load waits
+        self._limiter = AsyncLimiter(max_rate, time_period)
+        # a batch may never need more tokens than the bucket holds
+        self._batch_size = max(1, min(FORWARD_BATCH_SIZE, int(max_rate)))
+        # caps how many targets are in flight at once during a fan-out
+        self._send_sem = asyncio.Semaphore(max_concurrent_sends)
+        self._entities: dict[str, Any] = {}
+        # peer -> time.monotonic() before which it must not be sent to
+        self._cooldowns: dict[str, float] = {}
+        # peer -> latest background task retrying its flooded sends
+        self._deferred: dict[str, asyncio.Task] = {}
 
     @property
     def client(self) -> TelegramClient:
@@ -31,76 +80,233 @@ class TelegramGateway:
         return self._client
 
     async def connect(self) -> None:
-        await self._client.start()
-        logger.success(f"Logged in successfully")
+        await self._retry_on_flood(self._client.start, "login")
+        logger.success("Logged in successfully")
+
+    async def _entity(self, key: str) -> Any:
+        """Resolve *key* once and reuse the entity for later requests."""
+        ent = self._entities.get(key)
+        if ent is None:
+            # InputPeer is all requests need and is never re-resolved
+            ent = await self._client.get_input_entity(key)
+            if len(self._entities) >= ENTITY_CACHE_SIZE:
+                self._entities.clear()
+            self._entities[key] = ent
+        return ent
+
+    def _forget(self, key: str) -> None:
+        """Drop a cached entity so the next request resolves it afresh."""
+        self._entities.pop(key, None)
+
+    @staticmethod
+    def _log_flood(seconds: int, peer: str) -> None:
+        logger.warning("Flood-wait {} s on {}", seconds, peer)
+
+    async def _retry_on_flood(self, call: Callable[[], Awaitable[T]], peer: str) -> T:
+        """Run *call*, sleeping out (clamped) flood-waits up to FLOOD_RETRIES times."""
+        for _ in range(FLOOD_RETRIES - 1):
+            try:
+                return await call()
+            except FloodWaitError as fwe:
+                self._log_flood(fwe.seconds, peer)
+                await asyncio.sleep(min(fwe.seconds, MAX_FLOOD_WAIT_SECONDS))
+        return await call()
 
     # ---------- Queries --------------------------------------------------
 
     async def fetch_today_texts(
         self, channel: str, tz: str
+    ) -> List[TextMessage]:
+        """Today's text-only posts in *channel*, oldest first."""
+        return await self._retry_on_flood(
+            lambda: self._fetch_today_texts(channel, tz), channel
+        )
+
+    async def _fetch_today_texts(
+        self, channel: str, tz: str
     ) -> List[TextMessage]:
         day_start = start_of_today(tz)
+        source = await self._entity(channel)
         msgs: list[TextMessage] = []
-        offset = 0
-        while True:
-            chunk: Iterable[Message] = await self._client.get_messages(
-                channel, limit=100, offset_id=offset
-            )
-            if not chunk:
-                break
-            for m in chunk:
-                if m.date.replace(tzinfo=None) < day_start.replace(tzinfo=None):
-                    break
-                if m.message and m.media is None:
-                    msgs.append(
-                        TextMessage(
-                            message_id=m.id,
-                            date=m.date,
-                            content=m.message,
-                            raw=m,
-                        )
-                    )
-            offset = chunk[-1].id
-            if chunk[-1].date.replace(tzinfo=None) < day_start.replace(tzinfo=None):
-                break
-        msgs.reverse()
-        logger.info(f"Fetched {len(msgs)} text messages from today.")
+        append = msgs.append  # bound once for the per-message loop
+        # reverse=True + offset_date: server returns only today's posts,
+        # oldest first, and Telethon handles the paging. With no limit Telethon
+        # would sleep 1 s between pages; wait_time=0 fetches them back-to-back.
+        async for m in self._client.iter_messages(
+            source, offset_date=day_start, reverse=True, wait_time=0
+        ):
+            if _is_text_post(m):
+                append(TextMessage(m.id, m.date, m.message, m))
+        logger.info("Fetched {} text messages from today.", len(msgs))
         return msgs
 
-    async def list_public_groups(self) -> List[str]:
+    async def iter_public_groups(self) -> AsyncIterator[str]:
         """
-        Retrieve all **public** groups/supergroups the logged-in user belongs to.
+        Yield the ``@handle`` of every **public** group/supergroup the
+        logged-in user belongs to, as dialogs are paged in.
         """
-        results: list[str] = []
-        # async for over the iterator
         async for dialog in self._client.iter_dialogs():
+            entity = dialog.entity
+            # cheapest reject first: most dialogs (DMs, private groups) have
+            # no username
+            username = getattr(entity, "username", None)
+            if not username:
+                continue
             # Identify normal groups or megagroups
-            is_group = dialog.is_group or getattr(dialog.entity, "megagroup", False)
-            username = getattr(dialog.entity, "username", None)
-            if is_group and username:
-                handle = username if username.startswith("@") else f"@{username}"
-                results.append(handle)
+            if not (dialog.is_group or getattr(entity, "megagroup", False)):
+                continue
+            yield username if username[0] == "@" else "@" + username
+
+    async def list_public_groups(self) -> List[str]:
+        """
+        Retrieve all **public** groups/supergroups the logged-in user belongs to.
+        """
+        async def collect() -> List[str]:
+            return [h async for h in self.iter_public_groups()]
 
+        results = await self._retry_on_flood(collect, "dialogs")
         logger.info("Found {} public groups.", len(results))
         return results
 
+    # ---------- Subscriptions --------------------------------------------
+
+    async def subscribe_channel(
+        self, channel: str, queue: asyncio.Queue[TextMessage]
+    ) -> None:
+        """
+        Push every new **text-only** post in *channel* onto *queue* as it
+        arrives, so callers never have to poll history for new messages.
+        """
+        source = await self._retry_on_flood(lambda: self._entity(channel), channel)
+
+        @self._client.on(events.NewMessage(chats=source))
+        async def _on_new(event: events.NewMessage.Event) -> None:
+            m = event.message
+            if _is_text_post(m):
+                queue.put_nowait(TextMessage(m.id, m.date, m.message, m))
+
     # ---------- Commands -------------------------------------------------
 
+    def _note_flood(self, tg: str, seconds: int) -> None:
+        """Record a cooldown for *tg*; never shortens one already recorded."""
+        self._log_flood(seconds, tg)
+        # jitter so deferred retries don't fire in lock-step
+        wait = min(seconds, MAX_FLOOD_WAIT_SECONDS) + random.random()
+        self._cooldowns[tg] = max(
+            self._cooldowns.get(tg, 0.0), time.monotonic() + wait
+        )
+
+    def _is_blocked(self, tg: str) -> bool:
+        """True while *tg* is cooling down or still has deferred sends queued."""
+        return tg in self._deferred or self._cooldowns.get(tg, 0.0) > time.monotonic()
+
+    async def _cool_down(self, tg: str) -> None:
+        """Wait out a pending flood-wait on *tg*; other peers are unaffected."""
+        remaining = self._cooldowns.get(tg, 0.0) - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    async def _send_once(self, entity: Any, batch: List[Any]) -> None:
+        """Forward *batch* in a single request, paced by the shared limiter."""
+        # one token per forwarded message, not per request
+        await self._limiter.acquire(len(batch))
+        async with self._send_sem:
+            await self._client.forward_messages(entity, batch)
+
+    async def _send_batch(self, tg: str, entity: Any, batch: List[Any]) -> None:
+        """Forward one batch, retrying the same batch after a flood-wait."""
+        for attempt in range(1, FLOOD_RETRIES + 1):
+            # wait outside the semaphore so a flooded peer holds no send slot
+            await self._cool_down(tg)
+            try:
+                await self._send_once(entity, batch)
+                return
+            except FloodWaitError as fwe:
+                self._note_flood(tg, fwe.seconds)
+                if attempt == FLOOD_RETRIES:
+                    raise
+
+    def _defer(self, tg: str, raws: List[Any]) -> None:
+        """
+        Hand *raws* for a flooded peer to a background task so the current
+        fan-out returns at once. Tasks per peer are chained to keep order.
+        """
+        logger.info("Deferring {} msg(s) to {} until its flood-wait ends", len(raws), tg)
+        task = asyncio.create_task(
+            self._send_deferred(tg, raws, self._deferred.get(tg))
+        )
+        self._deferred[tg] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if self._deferred.get(tg) is t:
+                del self._deferred[tg]
+
+        task.add_done_callback(_done)
+
+    async def _send_deferred(
+        self, tg: str, raws: List[Any], prev: asyncio.Task | None
+    ) -> None:
+        if prev is not None:
+            await asyncio.wait([prev])
+        try:
+            entity = await self._retry_on_flood(lambda: self._entity(tg), tg)
+            for i in range(0, len(raws), self._batch_size):
+                await self._send_batch(tg, entity, raws[i:i + self._batch_size])
+            logger.info("Delivered {} deferred msg(s) to {}", len(raws), tg)
+        except Exception as exc:  # noqa: BLE001
+            if isinstance(exc, PeerIdInvalidError):
+                self._forget(tg)  # stale access hash; re-resolve next time
+            logger.error("Cannot forward to {}: {}", tg, exc)
+
+    async def _forward_to(self, tg: str, raws: List[Any]) -> None:
+        # a flooded peer must not hold up this fan-out for the other targets
+        if self._is_blocked(tg):
+            self._defer(tg, raws)
+            return
+        try:
+            entity = await self._entity(tg)
+            # one ForwardMessagesRequest per batch instead of one per message
+            for i in range(0, len(raws), self._batch_size):
+                batch = raws[i:i + self._batch_size]
+                try:
+                    await self._send_once(entity, batch)
+                except FloodWaitError as fwe:
+                    self._note_flood(tg, fwe.seconds)
+                    self._defer(tg, raws[i:])
+                    return
+                logger.debug("Forwarded {} msg(s) to {}", len(batch), tg)
+        except FloodWaitError as fwe:  # while resolving the entity
+            self._note_flood(tg, fwe.seconds)
+            self._defer(tg, raws)
+        except PeerIdInvalidError:
+            self._forget(tg)  # stale access hash; re-resolve next time
+            raise
+
+    async def forward_texts(
+        self,
+        targets: Iterable[str],
+        messages: Iterable[TextMessage],
+    ) -> None:
+        """
+        Forward *messages* (in order) to every target, batching them into as
+        few requests as Telegram allows.
+        """
+        raws = [m.raw for m in messages]
+        if not raws:
+            return
+        targets = list(targets)
+        # groups are independent peers: pipeline the sends on one connection
+        results = await asyncio.gather(
+            *(self._forward_to(tg, raws) for tg in targets),
+            return_exceptions=True,
+        )
+        for tg, res in zip(targets, results):
+            if isinstance(res, Exception):
+                logger.error("Cannot forward to {}: {}", tg, res)
+
     async def forward_text(
         self,
         targets: Iterable[str],
         message: TextMessage,
-        delay: float,
     ) -> None:
-        if not message.raw:
-            logger.debug(f"Skipping empty text for msg_id={message.message_id}")
-            return
-        for tg in targets:
-            try:
-                await self._client.forward_messages(tg, message.raw)
-                await asyncio.sleep(delay)
-            except FloodWaitError as fwe:
-                logger.warning("Flood-wait {fwe.seconds} s while sending to {tg}")
-                await asyncio.sleep(fwe.seconds)
-            except Exception as exc:  # noqa: BLE001
-                logger.error(f"Cannot forward to {tg}: {exc}")
+        await self.forward_texts(targets, [message])
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 
+@lru_cache(maxsize=8)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
 def start_of_today(tz_name: str) -> datetime:
     """
     Return ``YYYY-MM-DD 00:00:00`` in *tz_name* as an offset-aware ``datetime``.
@@ -15,5 +21,26 @@ def start_of_today(tz_name: str) -> datetime:
     tz_name:
         IANA time-zone string (e.g. ``"Asia/Tehran"``).
     """
-    now = datetime.now(ZoneInfo(tz_name))
+    now = datetime.now(_zone(tz_name))
     return now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def seconds_until_hour(
+    tz_name: str, hour: int, now: datetime | None = None
+) -> float:
+    """
+    Real seconds from *now* (default: current time) until the next ``HH:00``
+    wall-clock time in *tz_name*.
+
+    If *hour* has already started today the next occurrence is tomorrow. The
+    difference is taken in UTC so DST transitions are accounted for.
+    """
+    zone = _zone(tz_name)
+    now = datetime.now(zone) if now is None else now.astimezone(zone)
+    target = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    # same-zone subtraction would use wall-clock time and ignore DST shifts
+    return (
+        target.astimezone(timezone.utc) - now.astimezone(timezone.utc)
+    ).total_seconds()
@@ -8,8 +8,6 @@ from dotenv import load_dotenv
 
 from .config import settings
 from .infrastructure.logger_setup import logger as _ 
-from .infrastructure.telegram_gateway import TelegramGateway
-from .application.use_cases import ForwardDailyTexts, ForwardOnNew
 
 
 load_dotenv()
@@ -17,10 +15,17 @@ load_dotenv()
 
 
 async def bootstrap() -> None:
+    # deferred: Telethon's import chain is heavy and only needed from here on
+    from .infrastructure.telegram_gateway import TelegramGateway
+    from .application.use_cases import ForwardDailyTexts, ForwardOnNew
+
     gw = TelegramGateway(
         session=settings.session_name,
         api_id=settings.api_id,
-        api_hash=settings.api_hash
+        api_hash=settings.api_hash,
+        max_rate=settings.forward_rate,
+        time_period=settings.forward_rate_period,
+        max_concurrent_sends=settings.max_concurrent_sends,
     )
     await gw.connect()
 
@@ -36,8 +41,14 @@ async def bootstrap() -> None:
         await usecase.run_forever()
 
 def main() -> None:
+    run = asyncio.run
+    try:
+        import uvloop  # optional, libuv-backed loop (not on Windows)
+        run = uvloop.run
+    except ImportError:
+        pass
     try:
-        asyncio.run(bootstrap())
+        run(bootstrap())
     except KeyboardInterrupt:
         logger.warning("Shutting down on user interrupt")
 
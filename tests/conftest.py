@@ -0,0 +1,85 @@
+"""
+Shared test setup: minimal settings in the environment, an offline
+Telethon stub when the real package is not installed, and a fake clock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import types
+
+import pytest
+
+os.environ.setdefault("TELEGRAM_API_ID", "1")
+os.environ.setdefault("TELEGRAM_API_HASH", "test")
+os.environ.setdefault("SOURCE_CHANNEL", "@source")
+os.environ.setdefault("TARGET_GROUPS", '["@g1", "@g2"]')
+os.environ.setdefault("TIMEZONE", "Asia/Tehran")
+
+
+def _stub_telethon() -> None:
+    telethon = types.ModuleType("telethon")
+    errors = types.ModuleType("telethon.errors")
+    tl = types.ModuleType("telethon.tl")
+    tl_types = types.ModuleType("telethon.tl.types")
+
+    class FloodWaitError(Exception):
+        def __init__(self, seconds: int = 0) -> None:
+            super().__init__(f"flood wait {seconds}s")
+            self.seconds = seconds
+
+    class PeerIdInvalidError(Exception):
+        pass
+
+    class MessageMediaWebPage:
+        pass
+
+    class MessageMediaPhoto:
+        pass
+
+    class TelegramClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+    errors.FloodWaitError = FloodWaitError
+    errors.PeerIdInvalidError = PeerIdInvalidError
+    tl_types.MessageMediaWebPage = MessageMediaWebPage
+    tl_types.MessageMediaPhoto = MessageMediaPhoto
+    telethon.TelegramClient = TelegramClient
+    telethon.events = types.SimpleNamespace()
+    telethon.errors = errors
+    telethon.tl = tl
+    tl.types = tl_types
+    sys.modules.update(
+        {
+            "telethon": telethon,
+            "telethon.errors": errors,
+            "telethon.tl": tl,
+            "telethon.tl.types": tl_types,
+        }
+    )
+
+
+try:
+    import telethon  # noqa: F401
+except ImportError:
+    _stub_telethon()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; asyncio.sleep advances it instead of waiting."""
+    from teleforwarder.infrastructure import rate_limiter
+
+    now = [0.0]
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        now[0] += seconds
+        await real_sleep(0)
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+    return now
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from teleforwarder.infrastructure.rate_limiter import AsyncLimiter
+
+
+def test_burst_up_to_capacity_does_not_wait(clock):
+    async def run():
+        limiter = AsyncLimiter(3, 60)
+        for _ in range(3):
+            async with limiter:
+                pass
+
+    asyncio.run(run())
+    assert clock[0] == 0.0
+
+
+def test_waits_for_refill_once_empty(clock):
+    async def run():
+        limiter = AsyncLimiter(2, 10)  # one token per 5 s
+        for _ in range(3):
+            await limiter.acquire()
+
+    asyncio.run(run())
+    assert clock[0] == pytest.approx(5.0)
+
+
+def test_refill_is_capped_at_capacity(clock):
+    async def run():
+        limiter = AsyncLimiter(2, 2)
+        for _ in range(2):
+            await limiter.acquire()
+        clock[0] += 100  # long idle must not bank more than 2 tokens
+        for _ in range(2):
+            await limiter.acquire()
+        start = clock[0]
+        await limiter.acquire()
+        return clock[0] - start
+
+    assert asyncio.run(run()) == pytest.approx(1.0)
+
+
+def test_acquire_many_tokens_waits_for_all(clock):
+    async def run():
+        limiter = AsyncLimiter(4, 4)  # one token per second
+        await limiter.acquire(4)
+        await limiter.acquire(3)
+
+    asyncio.run(run())
+    assert clock[0] == pytest.approx(3.0)
+
+
+def test_fractional_rate_does_not_stall_on_rounding(clock):
+    async def run():
+        limiter = AsyncLimiter(30, 1)  # 1/30 s per token is not exact in binary
+        for _ in range(150):
+            await limiter.acquire()
+
+    asyncio.run(run())
+    assert clock[0] == pytest.approx(4.0)
+
+
+def test_amount_above_capacity_is_rejected():
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncLimiter(2, 60).acquire(3))
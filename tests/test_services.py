@@ -0,0 +1,18 @@
+from teleforwarder.domain.services import batched, round_robin
+
+
+def test_round_robin_wraps_from_start_index():
+    assert list(round_robin([1, 2, 3, 4, 5], 3)) == [4, 5, 1, 2, 3]
+
+
+def test_round_robin_empty():
+    assert list(round_robin([], 0)) == []
+
+
+def test_batched_splits_remainder():
+    assert list(batched([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+
+
+def test_batched_over_wrapped_round_robin():
+    msgs = [1, 2, 3, 4, 5]
+    assert list(batched(round_robin(msgs, 3), 2)) == [[4, 5], [1, 2], [3]]
@@ -0,0 +1,143 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from telethon.errors import FloodWaitError, PeerIdInvalidError  # noqa: E402
+from telethon.tl.types import MessageMediaPhoto, MessageMediaWebPage  # noqa: E402
+
+from teleforwarder.domain.model import TextMessage  # noqa: E402
+from teleforwarder.infrastructure import telegram_gateway  # noqa: E402
+from teleforwarder.infrastructure.telegram_gateway import (  # noqa: E402
+    TelegramGateway,
+    _is_text_post,
+)
+
+
+class FakeClient:
+    """Records forwards instead of talking to Telegram."""
+
+    def __init__(self, *args, **kwargs):
+        self.sent = []
+        self.resolved = []
+        # peer -> outcomes of its next forwards: flood-wait seconds or None (ok)
+        self.floods = {}
+        self.invalid = set()
+
+    async def get_input_entity(self, key):
+        self.resolved.append(key)
+        return key
+
+    async def forward_messages(self, entity, batch):
+        if entity in self.invalid:
+            raise PeerIdInvalidError()
+        outcomes = self.floods.get(entity)
+        if outcomes:
+            seconds = outcomes.pop(0)
+            if seconds is not None:
+                raise FloodWaitError(seconds)
+        self.sent.append((entity, list(batch)))
+
+
+@pytest.fixture
+def make_gateway(monkeypatch):
+    monkeypatch.setattr(telegram_gateway, "TelegramClient", FakeClient)
+    return lambda **kwargs: TelegramGateway("session", 1, "hash", **kwargs)
+
+
+@pytest.fixture
+def gateway(make_gateway):
+    return make_gateway()
+
+
+def _msg(message_id):
+    return TextMessage(message_id, None, f"post {message_id}", f"raw-{message_id}")
+
+
+def test_default_rate_is_not_slower_than_one_send_per_second(clock, gateway):
+    targets = [f"@g{i}" for i in range(50)]
+
+    async def run():
+        for i in range(3):
+            await gateway.forward_text(targets, _msg(i))
+
+    asyncio.run(run())
+    assert len(gateway.client.sent) == 150
+    # 30 go out in the burst, the other 120 at 30/s; a 1 s sleep per send
+    # would have taken 150 s
+    assert clock[0] == pytest.approx(4.0)
+
+
+def test_flooded_peer_is_deferred_without_blocking_others(gateway):
+    gateway.client.floods["@g1"] = [30]
+
+    async def run():
+        # real clock: returning at all proves nobody slept out the 30 s
+        await gateway.forward_text(["@g1", "@g2"], _msg(1))
+        task = gateway._deferred["@g1"]
+        pending = not task.done()
+        task.cancel()
+        return pending
+
+    assert asyncio.run(run())
+    assert gateway.client.sent == [("@g2", ["raw-1"])]
+
+
+def test_deferred_batches_arrive_in_order(clock, make_gateway):
+    gateway = make_gateway(max_rate=2)  # batches of two
+    gateway.client.floods["@g1"] = [None, 10]  # second batch floods
+
+    async def run():
+        await gateway.forward_texts(["@g1"], [_msg(i) for i in range(5)])
+        await gateway._deferred["@g1"]
+
+    asyncio.run(run())
+    assert gateway.client.sent == [
+        ("@g1", ["raw-0", "raw-1"]),
+        ("@g1", ["raw-2", "raw-3"]),
+        ("@g1", ["raw-4"]),
+    ]
+
+
+def test_second_call_to_blocked_peer_chains_behind_first(clock, gateway):
+    # the deferred retry floods once more, so the first task is still
+    # pending when the second call arrives
+    gateway.client.floods["@g1"] = [10, 10]
+
+    async def run():
+        await gateway.forward_text(["@g1"], _msg(1))
+        first = gateway._deferred["@g1"]
+        await gateway.forward_text(["@g1"], _msg(2))
+        second = gateway._deferred["@g1"]
+        assert second is not first
+        await second
+        return first.done()
+
+    assert asyncio.run(run())
+    assert gateway.client.sent == [("@g1", ["raw-1"]), ("@g1", ["raw-2"])]
+
+
+def test_invalid_peer_evicts_cached_entity(clock, gateway):
+    gateway.client.invalid.add("@g1")
+
+    async def run():
+        await gateway.forward_text(["@g1", "@g2"], _msg(1))
+        gateway.client.invalid.clear()
+        await gateway.forward_text(["@g1", "@g2"], _msg(2))
+
+    asyncio.run(run())
+    # @g1 is resolved again after the failure, @g2 comes from the cache
+    assert gateway.client.resolved == ["@g1", "@g2", "@g1"]
+    assert ("@g1", ["raw-2"]) in gateway.client.sent
+
+
+def test_text_post_accepts_link_preview_and_rejects_photo():
+    def post(message, media=None):
+        return SimpleNamespace(message=message, media=media)
+
+    assert _is_text_post(post("hello"))
+    assert _is_text_post(post("see https://example.com", MessageMediaWebPage()))
+    assert not _is_text_post(post("caption", MessageMediaPhoto()))
+    assert not _is_text_post(post(""))
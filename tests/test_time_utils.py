@@ -0,0 +1,42 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from teleforwarder.infrastructure.time_utils import seconds_until_hour, start_of_today
+
+TEHRAN = ZoneInfo("Asia/Tehran")
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def test_start_of_today_is_local_midnight():
+    start = start_of_today("Asia/Tehran")
+    assert (start.hour, start.minute, start.second) == (0, 0, 0)
+    assert start.tzinfo is not None
+
+
+def test_seconds_until_hour_later_today():
+    now = datetime(2025, 1, 10, 6, 30, tzinfo=TEHRAN)
+    assert seconds_until_hour("Asia/Tehran", 8, now) == pytest.approx(1.5 * 3600)
+
+
+def test_seconds_until_hour_rolls_to_tomorrow():
+    now = datetime(2025, 1, 10, 23, 0, tzinfo=TEHRAN)
+    assert seconds_until_hour("Asia/Tehran", 8, now) == pytest.approx(9 * 3600)
+
+
+def test_seconds_until_hour_at_the_hour_means_tomorrow():
+    now = datetime(2025, 1, 10, 8, 0, tzinfo=TEHRAN)
+    assert seconds_until_hour("Asia/Tehran", 8, now) == pytest.approx(24 * 3600)
+
+
+def test_seconds_until_hour_spring_forward():
+    # 2024-03-10 02:00 EST jumps to 03:00 EDT: only 7 real hours to 08:00
+    now = datetime(2024, 3, 10, 0, 0, tzinfo=NEW_YORK)
+    assert seconds_until_hour("America/New_York", 8, now) == pytest.approx(7 * 3600)
+
+
+def test_seconds_until_hour_fall_back():
+    # 2024-11-03 02:00 EDT falls back to 01:00 EST: 9 real hours to 08:00
+    now = datetime(2024, 11, 3, 0, 0, tzinfo=NEW_YORK)
+    assert seconds_until_hour("America/New_York", 8, now) == pytest.approx(9 * 3600)
@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("loguru")
+pytest.importorskip("pydantic_settings")
+
+from teleforwarder.application.use_cases import ForwardDailyTexts  # noqa: E402
+from teleforwarder.config import settings  # noqa: E402
+from teleforwarder.domain.model import TextMessage  # noqa: E402
+from teleforwarder.infrastructure.time_utils import start_of_today  # noqa: E402
+
+
+def _msg(message_id, date):
+    return TextMessage(message_id, date, f"post {message_id}", object())
+
+
+@pytest.fixture
+def day_start():
+    return start_of_today(settings.timezone)
+
+
+def test_append_new_drops_posts_queued_before_midnight(day_start):
+    uc = ForwardDailyTexts(gateway=None)
+    yesterday = _msg(10, day_start - timedelta(hours=2))
+    today = _msg(11, day_start + timedelta(minutes=5))
+
+    uc._append_new([yesterday, today])
+
+    assert [m.message_id for m in uc._messages] == [11]
+
+
+def test_append_new_empty_backfill_keeps_only_today(day_start):
+    uc = ForwardDailyTexts(gateway=None)
+    uc._append_new([_msg(10, day_start - timedelta(seconds=1))])
+    assert uc._messages == []
+
+
+def test_append_new_skips_backfill_overlap(day_start):
+    uc = ForwardDailyTexts(gateway=None)
+    uc._messages = [_msg(5, day_start + timedelta(minutes=1))]
+
+    uc._append_new(
+        [
+            _msg(4, day_start + timedelta(seconds=30)),
+            _msg(5, day_start + timedelta(minutes=1)),
+            _msg(6, day_start + timedelta(minutes=2)),
+        ]
+    )
+
+    assert [m.message_id for m in uc._messages] == [5, 6]